@@ -103,6 +103,41 @@ def co2_absorption(session: nox.Session) -> None:
     session.run("python", "-m", "simulationen.co2_absorptionsgrad")
 
 
+@nox.session(reuse_venv=True)
+def co2_ensemble(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2absorption"])
+
+    session.run("python", "-m", "simulationen.co2_ensemble")
+
+
+@nox.session(reuse_venv=True)
+def co2_paritaet(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2absorption"])
+
+    session.run("python", "-m", "simulationen.co2_paritaet")
+
+
+@nox.session(reuse_venv=True)
+def co2_schmalband(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2absorption"])
+
+    session.run("python", "-m", "simulationen.co2_schmalband")
+
+
+@nox.session(reuse_venv=True)
+def co2_temperatur(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2absorption"])
+
+    session.run("python", "-m", "simulationen.co2_temperatur")
+
+
+@nox.session(reuse_venv=True)
+def co2_sensitivitaet(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2"])
+
+    session.run("python", "-m", "simulationen.co2_sensitivitaet")
+
+
 @nox.session(reuse_venv=True)
 def co2_schwingung(session: nox.Session) -> None:
     uv_sync(session, groups=["co2"])
@@ -110,6 +145,13 @@ def co2_schwingung(session: nox.Session) -> None:
     session.run("python", "-m", "simulationen.co2_v2_schwingung")
 
 
+@nox.session(reuse_venv=True)
+def startzeit(session: nox.Session) -> None:
+    uv_sync(session, groups=["co2"])
+
+    session.run("python", "-m", "simulationen.startzeit")
+
+
 @nox.session(reuse_venv=True)
 def ruff(session: nox.Session) -> None:
     uv_sync(session, groups=["ruff"])
@@ -1,5 +1,32 @@
 from __future__ import annotations
 
+import importlib.util
 import pathlib as p
+import sys
+import typing as t
+
+if t.TYPE_CHECKING:
+    import types
 
 ROOT_DIR = p.Path(__file__).parent.parent
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Importiert ein Modul erst beim ersten Attributzugriff
+
+    Für schwere Abhängigkeiten (matplotlib, pandas, scipy), damit das bloße Importieren einer Simulation schnell
+    bleibt.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -2,13 +2,10 @@ from __future__ import annotations
 
 import numpy as np
 
-from simulationen import ROOT_DIR
+from simulationen.datasets import hitran_lines
 from simulationen.formeln import effective_pressure
 from simulationen.utils import calculate_total_emissivity
 from simulationen.utils import create_absorption_spectrum
-from simulationen.utils import read_hitran_par
-
-FILENAME = ROOT_DIR / "data" / "hitran_co2_2025-11-04.par"
 
 PATH_LENGTH = 8000
 # Die Atmosphäre ist ca. 8km hoch, deswegen nehmen wir an das sich auf 8km eine konstante CO2-Konzentration ergibt.
@@ -25,7 +22,7 @@ TEMPERATURE_SURFACE = 288
 
 
 def main() -> None:
-    df = read_hitran_par(FILENAME)
+    df = hitran_lines()
 
     wn_min = df["wavenumber"].min()
     wn_max = df["wavenumber"].max()
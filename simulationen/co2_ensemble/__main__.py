@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+
+from simulationen.datasets import hitran_lines
+from simulationen.ensemble import Normal
+from simulationen.ensemble import run_ensemble
+
+PATH_LENGTH = Normal(8000, 1000)
+# Höhe der gut durchmischten Schicht, vgl. co2_absorptionsgrad
+
+CONCENTRATION = Normal(425e-6, 5e-6)
+# 425 ppm (NOAA 2025) mit Unsicherheit durch saisonale und regionale Schwankungen
+
+TEMPERATURE = Normal(255, 10)
+# Emissionstemperatur der Erde
+
+GAMMA = Normal(0.1, 0.015)
+# Luftverbreiterungskoeffizient in cm^-1/atm, typische HITRAN-Werte für CO2 liegen bei 0.06-0.1
+
+TEMPERATURE_SURFACE = 288
+
+N_GROUPS = 16
+MEMBERS_PER_GROUP = 32
+
+
+def main() -> None:
+    df = hitran_lines()
+
+    wn_min = df["wavenumber"].min()
+    wn_max = df["wavenumber"].max()
+
+    points_per_linewidth = 0.08
+    delta_wn = GAMMA.mean / points_per_linewidth
+    n_points = int((wn_max - wn_min) / delta_wn)
+    wn_grid = np.linspace(wn_min, wn_max, n_points)
+
+    result = run_ensemble(
+        df["wavenumber"].to_numpy(),
+        df["intensity"].to_numpy(),
+        wn_grid,
+        gamma=GAMMA,
+        path_length=PATH_LENGTH,
+        temperature=TEMPERATURE,
+        concentration=CONCENTRATION,
+        temperature_surface=TEMPERATURE_SURFACE,
+        n_groups=N_GROUPS,
+        members_per_group=MEMBERS_PER_GROUP,
+        seed=0,
+    )
+
+    print(f"Mitglieder: {result.emissivity.size}")  # noqa: T201
+    print(f"Mittelwert: {result.mean:.4f} ± {result.std:.4f}")  # noqa: T201
+    for q, value in result.percentiles().items():
+        print(f"P{q:g}: {value:.4f}")  # noqa: T201
+    for name, correlation in result.sensitivities().items():
+        print(f"Sensitivität {name}: {correlation:+.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
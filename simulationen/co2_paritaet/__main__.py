@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from simulationen.datasets import dataset_path
+from simulationen.datasets import hitran_lines
+from simulationen.parity import check_emissivity_engines
+from simulationen.parity import check_reader_engines
+from simulationen.parity import check_spectrum_engines
+from simulationen.parity import format_report
+from simulationen.parity import main_scenarios
+from simulationen.parity import synthetic_scenarios
+
+TOLERANCE = 1e-6
+# maximale absolute Abweichung in Absorptionsgrad und Emissivität
+
+
+def main() -> None:
+    scenarios = synthetic_scenarios()
+    if dataset_path("co2").exists():
+        scenarios += main_scenarios(hitran_lines())
+    else:
+        print(f"{dataset_path('co2')} nicht gefunden, nur synthetische Szenarien")  # noqa: T201
+
+    results = check_spectrum_engines(scenarios) + check_emissivity_engines(scenarios) + check_reader_engines()
+
+    print(format_report(results, TOLERANCE))  # noqa: T201
+
+    if not all(result.passed(TOLERANCE) for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
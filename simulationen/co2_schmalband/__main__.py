@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from simulationen.datasets import hitran_lines
+from simulationen.formeln import effective_pressure
+from simulationen.narrow_band import band_average
+from simulationen.narrow_band import fit_band_parameters
+from simulationen.narrow_band import narrow_band_emissivity
+from simulationen.narrow_band import narrow_band_transmission
+from simulationen.utils import calculate_total_emissivity
+from simulationen.utils import create_absorption_spectrum
+
+PATH_LENGTH = 8000
+CONCENTRATION = 425e-6
+TEMPERATURE = 255
+TEMPERATURE_SURFACE = 288
+GAMMA = 0.1
+
+BAND_WIDTH = 10.0
+# Intervallbreite in cm^-1, das Modell ist für 5-25 cm^-1 gedacht
+
+CONCENTRATIONS = (280e-6, 425e-6, 560e-6, 1120e-6)
+# vorindustriell, heute, Verdopplung, Vervierfachung
+
+
+def main() -> None:
+    df = hitran_lines()
+    wavenumbers = df["wavenumber"].to_numpy()
+    intensities = df["intensity"].to_numpy()
+
+    wn_min = wavenumbers.min()
+    wn_max = wavenumbers.max()
+
+    points_per_linewidth = 0.08
+    delta_wn = GAMMA / points_per_linewidth
+    n_points = int((wn_max - wn_min) / delta_wn)
+    wn_grid = np.linspace(wn_min, wn_max, n_points)
+
+    settings = {
+        "path_length": PATH_LENGTH,
+        "concentration": CONCENTRATION,
+        "pressure": effective_pressure(PATH_LENGTH),
+        "temperature": TEMPERATURE,
+        "gamma": GAMMA,
+    }
+
+    start = time.perf_counter()
+    absorbance, _ = create_absorption_spectrum(wavenumbers, intensities, wn_grid, **settings)
+    epsilon_lbl = calculate_total_emissivity(wn_grid, absorbance, temperature=TEMPERATURE_SURFACE)
+    time_lbl = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parameters = fit_band_parameters(wavenumbers, intensities, BAND_WIDTH)
+    time_fit = time.perf_counter() - start
+
+    transmission_lbl = band_average(parameters, wn_grid, 1 - absorbance)
+
+    print(f"Linie-für-Linie: ε = {epsilon_lbl:.4f} ({time_lbl:.2f} s)")  # noqa: T201
+    print(f"Anpassung der Bandparameter: {time_fit:.3f} s")  # noqa: T201
+
+    for model in ("malkmus", "goody"):
+        start = time.perf_counter()
+        transmission = narrow_band_transmission(parameters, model=model, **settings)
+        epsilon = narrow_band_emissivity(parameters, transmission, temperature=TEMPERATURE_SURFACE)
+        time_model = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"{model}: ε = {epsilon:.4f}, Δε = {epsilon - epsilon_lbl:+.4f}, "
+            f"max Δτ = {np.nanmax(np.abs(transmission - transmission_lbl)):.3f}, "
+            f"{time_lbl / time_model:.0f}x schneller"
+        )
+
+    for concentration in CONCENTRATIONS:
+        transmission = narrow_band_transmission(parameters, **(settings | {"concentration": concentration}))
+        epsilon = narrow_band_emissivity(parameters, transmission, temperature=TEMPERATURE_SURFACE)
+        print(f"{concentration * 1e6:.0f} ppm: ε = {epsilon:.4f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
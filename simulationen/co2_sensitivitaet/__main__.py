@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+
+from simulationen import ROOT_DIR
+from simulationen.datasets import hitran_lines
+from simulationen.formeln import effective_pressure
+from simulationen.jacobians import create_absorption_spectrum_with_jacobians
+
+PATH_LENGTH = 8000
+CONCENTRATION = 425e-6
+TEMPERATURE = 255
+TEMPERATURE_SURFACE = 288
+GAMMA = 0.1
+
+PPM = 1e-6
+
+BIG_FONT_SIZE = 20
+SMALL_FONT_SIZE = 18
+
+
+def main() -> None:
+    from matplotlib import pyplot as plt  # noqa: PLC0415
+
+    df = hitran_lines()
+
+    wn_min = df["wavenumber"].min()
+    wn_max = df["wavenumber"].max()
+
+    points_per_linewidth = 0.08
+    delta_wn = GAMMA / points_per_linewidth
+    n_points = int((wn_max - wn_min) / delta_wn)
+    wn_grid = np.linspace(wn_min, wn_max, n_points)
+
+    result = create_absorption_spectrum_with_jacobians(
+        df["wavenumber"].to_numpy(),
+        df["intensity"].to_numpy(),
+        wn_grid,
+        path_length=PATH_LENGTH,
+        concentration=CONCENTRATION,
+        pressure=effective_pressure(PATH_LENGTH),
+        temperature=TEMPERATURE,
+        gamma=GAMMA,
+        lower_state_energy=df["lower_state_energy"].to_numpy(),
+        temperature_surface=TEMPERATURE_SURFACE,
+    )
+
+    derivatives = result.emissivity_derivatives
+    print(f"ε = {result.emissivity:.4f}")  # noqa: T201
+    print(f"∂ε/∂c = {derivatives['concentration'] * PPM:.3e} pro ppm")  # noqa: T201
+    print(f"∂ε/∂L = {derivatives['path_length']:.3e} pro m")  # noqa: T201
+    print(f"∂ε/∂gamma = {derivatives['gamma']:.3e} pro cm^-1/atm")  # noqa: T201
+    print(f"∂ε/∂T = {derivatives['temperature']:.3e} pro K")  # noqa: T201
+
+    _, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+
+    ax1.plot(wn_grid, result.emissivity_kernels["concentration"] * PPM, color="darkblue", linewidth=1.2)
+    ax1.set_ylabel(r"$\partial \varepsilon / \partial c$ [ppm$^{-1}$ cm]", fontsize=BIG_FONT_SIZE)
+    ax1.grid(True, alpha=0.3, linestyle="--")
+    ax1.tick_params(axis="both", labelsize=SMALL_FONT_SIZE)
+
+    ax2.plot(wn_grid, result.emissivity_kernels["temperature"], color="darkred", linewidth=1.2)
+    ax2.set_xlabel(r"Wellenzahl $\eta$ [$\mathrm{cm}^{-1}$]", fontsize=BIG_FONT_SIZE)
+    ax2.set_ylabel(r"$\partial \varepsilon / \partial T$ [K$^{-1}$ cm]", fontsize=BIG_FONT_SIZE)
+    ax2.grid(True, alpha=0.3, linestyle="--")
+    ax2.tick_params(axis="both", labelsize=SMALL_FONT_SIZE)
+    ax2.set_xlim(500, 2500)
+
+    plt.tight_layout()
+    plt.savefig(ROOT_DIR / "seminararbeit" / "assets" / "co2_sensitivitaet.pdf", bbox_inches="tight")
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
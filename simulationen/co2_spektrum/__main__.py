@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import numpy as np
-from matplotlib import pyplot as plt
 
 from simulationen import ROOT_DIR
+from simulationen.datasets import hitran_lines
+from simulationen.export import export_spectrum
 from simulationen.utils import create_absorption_spectrum
-from simulationen.utils import read_hitran_par
 
-FILENAME = ROOT_DIR / "data" / "hitran_co2_2025-11-04.par"
+EXPORT_DIR = ROOT_DIR / "seminararbeit" / "daten" / "co2_absorption"
+CSV_POINTS = 4000
 
 
 V3_CENTER = 2349.16
@@ -21,7 +22,9 @@ WN_MAX_FILTER = 100000
 
 
 def main() -> None:
-    df = read_hitran_par(FILENAME)
+    from matplotlib import pyplot as plt  # noqa: PLC0415
+
+    df = hitran_lines()
 
     df_filtered = df[(df["wavenumber"] >= WN_MIN_FILTER) & (df["wavenumber"] <= WN_MAX_FILTER)].copy()
 
@@ -35,15 +38,21 @@ def main() -> None:
 
     wn_grid = np.linspace(wn_min, wn_max, n_points)
 
-    absorbance, _ = create_absorption_spectrum(
-        df_filtered["wavenumber"].values,
-        df_filtered["intensity"].values,
+    settings = {"path_length": 100.0, "pressure": 1.0, "temperature": 296, "concentration": 400e-6, "gamma": gamma}
+
+    absorbance, optical_depth = create_absorption_spectrum(
+        df_filtered["wavenumber"].values, df_filtered["intensity"].values, wn_grid, **settings
+    )
+
+    export_spectrum(
+        EXPORT_DIR,
         wn_grid,
-        path_length=100.0,
-        pressure=1.0,
-        temperature=296,
-        concentration=400e-6,
-        gamma=gamma,
+        absorbance,
+        optical_depth,
+        wavenumbers=df_filtered["wavenumber"].values,
+        intensities=df_filtered["intensity"].values,
+        csv_points=CSV_POINTS,
+        **settings,
     )
 
     wl_grid = 10000.0 / wn_grid
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import numpy as np
-from matplotlib import pyplot as plt
 
 from simulationen import ROOT_DIR
+from simulationen.datasets import hitran_lines
+from simulationen.export import export_spectrum
 from simulationen.utils import create_absorption_spectrum
-from simulationen.utils import read_hitran_par
 
-FILENAME = ROOT_DIR / "data" / "hitran_co2_2025-11-04.par"
+EXPORT_DIR = ROOT_DIR / "seminararbeit" / "daten" / "co2_absorption_under_1_5"
+CSV_POINTS = 2000
 
 
 WN_MIN_FILTER = 6666
@@ -15,7 +16,9 @@ WN_MAX_FILTER = 1000000
 
 
 def main() -> None:
-    df = read_hitran_par(FILENAME)
+    from matplotlib import pyplot as plt  # noqa: PLC0415
+
+    df = hitran_lines()
 
     df_filtered = df[(df["wavenumber"] >= WN_MIN_FILTER) & (df["wavenumber"] <= WN_MAX_FILTER)].copy()
 
@@ -23,15 +26,21 @@ def main() -> None:
     wn_max = df_filtered["wavenumber"].max()
     wn_grid = np.linspace(wn_min, wn_max, 5000)
 
-    absorbance, _ = create_absorption_spectrum(
-        df_filtered["wavenumber"].values,
-        df_filtered["intensity"].values,
+    settings = {"path_length": 100.0, "pressure": 1.0, "temperature": 296, "concentration": 400e-6, "gamma": 0.1}
+
+    absorbance, optical_depth = create_absorption_spectrum(
+        df_filtered["wavenumber"].values, df_filtered["intensity"].values, wn_grid, **settings
+    )
+
+    export_spectrum(
+        EXPORT_DIR,
         wn_grid,
-        path_length=100.0,
-        pressure=1.0,
-        temperature=296,
-        concentration=400e-6,
-        gamma=0.1,
+        absorbance,
+        optical_depth,
+        wavenumbers=df_filtered["wavenumber"].values,
+        intensities=df_filtered["intensity"].values,
+        csv_points=CSV_POINTS,
+        **settings,
     )
 
     wl_grid = 10000.0 / wn_grid
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
-import numpy as np
-from matplotlib import pyplot as plt
-
 from simulationen import ROOT_DIR
-from simulationen.utils import create_absorption_spectrum
-from simulationen.utils import read_hitran_par
-
-FILENAME = ROOT_DIR / "data" / "hitran_co2_2025-11-04.par"
+from simulationen.datasets import hitran_lines
+from simulationen.export import export_spectrum
+from simulationen.lazy_spectrum import LazySpectrum
 
-df = read_hitran_par(FILENAME)
+EXPORT_DIR = ROOT_DIR / "seminararbeit" / "daten" / "co2_absorption_v2_band"
+CSV_POINTS = 2000
 
 BIG_FONT = 24
 SMALL_FONT = 20
@@ -21,29 +18,41 @@ V2_CENTER = 667.38
 WN_MIN_FILTER = 630
 WN_MAX_FILTER = 710
 
+GAMMA = 0.1
+OVERVIEW_POINTS_PER_LINEWIDTH = 2
+# Übersicht über das ganze Band, bezogen auf die druckverbreiterte Breite (0.1 * 0.1 cm^-1),
+# entspricht dem bisherigen Gitterabstand von 0.005 cm^-1
+DETAIL_POINTS_PER_LINEWIDTH = 20
+# Q-Zweig-Detailansicht, nur dieser Ausschnitt wird fein berechnet
 
-def main() -> None:
-    df_filtered = df[(df["wavenumber"] >= WN_MIN_FILTER) & (df["wavenumber"] <= WN_MAX_FILTER)].copy()
 
-    wn_min = df_filtered["wavenumber"].min()
-    wn_max = df_filtered["wavenumber"].max()
+def main() -> None:
+    from matplotlib import pyplot as plt  # noqa: PLC0415
 
-    gamma = 0.1
-    points_per_linewidth = 20
-    delta_wn = gamma / points_per_linewidth
-    n_points = int((wn_max - wn_min) / delta_wn)
+    df = hitran_lines()
+    df_filtered = df[(df["wavenumber"] >= WN_MIN_FILTER) & (df["wavenumber"] <= WN_MAX_FILTER)].copy()
 
-    wn_grid = np.linspace(wn_min, wn_max, n_points)
+    settings = {"path_length": 1.0, "pressure": 0.1, "temperature": 296, "concentration": 400e-6, "gamma": GAMMA}
 
-    absorbance, _ = create_absorption_spectrum(
+    spectrum = LazySpectrum(
         df_filtered["wavenumber"].values,
         df_filtered["intensity"].values,
+        df_filtered["wavenumber"].min(),
+        df_filtered["wavenumber"].max(),
+        **settings,
+    )
+
+    wn_grid, absorbance, optical_depth = spectrum.overview(OVERVIEW_POINTS_PER_LINEWIDTH)
+
+    export_spectrum(
+        EXPORT_DIR,
         wn_grid,
-        path_length=1.0,
-        pressure=0.1,
-        temperature=296,
-        concentration=400e-6,
-        gamma=gamma,
+        absorbance,
+        optical_depth,
+        wavenumbers=df_filtered["wavenumber"].values,
+        intensities=df_filtered["intensity"].values,
+        csv_points=CSV_POINTS,
+        **settings,
     )
 
     absorbance_percent = absorbance * 100
@@ -70,15 +79,14 @@ def main() -> None:
     q_zweig_min = V2_CENTER - 1
     q_zweig_max = V2_CENTER + 2
 
-    q_mask = (wn_grid >= q_zweig_min) & (wn_grid <= q_zweig_max)
+    q_grid, q_absorbance, _ = spectrum.window(q_zweig_min, q_zweig_max, DETAIL_POINTS_PER_LINEWIDTH)
+    q_absorbance_percent = q_absorbance * 100
 
     ax2.axvspan(V2_CENTER - 5, V2_CENTER + 5, alpha=0.15, color="yellow")
 
-    ax2.plot(
-        wn_grid[q_mask], absorbance_percent[q_mask], color="darkblue", linewidth=LINEWIDTH, label=r"$\mathrm{CO_2}$"
-    )
+    ax2.plot(q_grid, q_absorbance_percent, color="darkblue", linewidth=LINEWIDTH, label=r"$\mathrm{CO_2}$")
 
-    ax2.fill_between(wn_grid[q_mask], 0, absorbance_percent[q_mask], color="darkblue", alpha=0.2)
+    ax2.fill_between(q_grid, 0, q_absorbance_percent, color="darkblue", alpha=0.2)
 
     ax2.axvline(V2_CENTER, color="red", linestyle="--", linewidth=LINEWIDTH_BIG, label=r"$\nu_2$-Bandzentrum")
 
@@ -87,14 +95,14 @@ def main() -> None:
     ax2.set_title(r"CO$_2$ Biegeschwingung $\nu_2$ Q-Zweig Detailansicht", fontsize=BIG_FONT)
     ax2.grid(True, alpha=0.3, linestyle="--")
     ax2.set_xlim(q_zweig_min, q_zweig_max)
-    ax2.set_ylim(0, max(absorbance_percent[q_mask]) * 1.1)
+    ax2.set_ylim(0, max(q_absorbance_percent) * 1.1)
     ax2.tick_params(axis="both", labelsize=SMALL_FONT)
     ax2.legend(loc="upper right", fontsize=SMALL_FONT)
 
     ax2.annotate(
         "Überlagerung vieler\nRotationslinien\n" + r"($\Delta$j = 0)",
-        xy=(V2_CENTER, max(absorbance_percent[q_mask]) * 0.5),
-        xytext=(V2_CENTER + 1.4, max(absorbance_percent[q_mask]) * 0.6),
+        xy=(V2_CENTER, max(q_absorbance_percent) * 0.5),
+        xytext=(V2_CENTER + 1.4, max(q_absorbance_percent) * 0.6),
         arrowprops={"arrowstyle": "->", "color": "black", "lw": 1.5},
         fontsize=SMALL_FONT,
         ha="center",
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+
+from simulationen.datasets import hitran_lines
+from simulationen.formeln import effective_pressure
+from simulationen.temperature_sweep import temperature_sweep
+
+PATH_LENGTH = 8000
+CONCENTRATION = 425e-6
+GAMMA = 0.1
+
+SURFACE_TEMPERATURES = np.arange(270, 311, 2)
+EMISSION_TEMPERATURES = np.arange(235, 276, 5)
+# um die Werte aus co2_absorptionsgrad (288 K Oberfläche, 255 K Emission)
+
+
+def main() -> None:
+    df = hitran_lines()
+
+    wn_min = df["wavenumber"].min()
+    wn_max = df["wavenumber"].max()
+
+    points_per_linewidth = 0.08
+    delta_wn = GAMMA / points_per_linewidth
+    n_points = int((wn_max - wn_min) / delta_wn)
+    wn_grid = np.linspace(wn_min, wn_max, n_points)
+
+    sweep = temperature_sweep(
+        df["wavenumber"].to_numpy(),
+        df["intensity"].to_numpy(),
+        wn_grid,
+        SURFACE_TEMPERATURES,
+        EMISSION_TEMPERATURES,
+        lower_state_energy=df["lower_state_energy"].to_numpy(),
+        path_length=PATH_LENGTH,
+        concentration=CONCENTRATION,
+        pressure=effective_pressure(PATH_LENGTH),
+        gamma=GAMMA,
+    )
+
+    flux = sweep.total_outgoing_flux
+    feedback = sweep.feedback
+
+    for i, emission_temperature in enumerate(EMISSION_TEMPERATURES):
+        print(f"T_Emission = {emission_temperature} K")  # noqa: T201
+        for j, surface_temperature in enumerate(SURFACE_TEMPERATURES):
+            print(  # noqa: T201
+                f"  T_Oberfläche = {surface_temperature} K: ε = {sweep.emissivity[i, j]:.4f}, "
+                f"F = {flux[i, j]:.1f} W/m², dF/dT = {feedback[i, j]:.2f} W/(m² K)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from simulationen import ROOT_DIR
@@ -11,6 +10,8 @@ OMEGA = 1
 
 
 def main() -> None:
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     t = np.linspace(0, PERIODS * 2 * np.pi, 500)
 
     x = t
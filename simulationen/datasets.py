@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import functools
+import typing as t
+
+from simulationen import ROOT_DIR
+from simulationen.utils import read_hitran_par
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    import pandas as pd
+
+DATASETS: dict[str, str] = {"co2": "hitran_co2_2025-11-04.par"}
+# Name -> Dateiname im Datenverzeichnis
+
+
+@functools.cache
+def data_dir() -> pathlib.Path:
+    """Datenverzeichnis, wird erst beim ersten Zugriff aufgelöst"""
+    return (ROOT_DIR / "data").resolve()
+
+
+def dataset_path(name: str) -> pathlib.Path:
+    if name not in DATASETS:
+        msg = f"Unknown dataset: {name!r}, available: {', '.join(DATASETS)}"
+        raise KeyError(msg)
+    return data_dir() / DATASETS[name]
+
+
+@functools.cache
+def hitran_lines(name: str = "co2") -> pd.DataFrame:
+    """
+    Liniensatz eines Datensatzes, wird pro Prozess nur einmal eingelesen
+
+    Alle Aufrufer bekommen denselben DataFrame, er darf deshalb nicht verändert werden.
+    """
+    return read_hitran_par(dataset_path(name))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulationen import lazy_import
+from simulationen.formeln import effective_pressure
+from simulationen.utils import calculate_cross_section
+from simulationen.utils import calculate_total_emissivity
+from simulationen.utils import number_density
+
+stats = lazy_import("scipy.stats")
+
+
+@dataclasses.dataclass(frozen=True)
+class Normal:
+    """Normalverteilter Parameter, Werte <= 0 werden an `minimum` abgeschnitten"""
+
+    mean: float
+    std: float
+    minimum: float = 1e-12
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.maximum(rng.normal(self.mean, self.std, size), self.minimum)
+
+
+@dataclasses.dataclass(frozen=True)
+class EnsembleResult:
+    samples: dict[str, np.ndarray]
+    emissivity: np.ndarray
+
+    @property
+    def mean(self) -> float:
+        return float(np.mean(self.emissivity))
+
+    @property
+    def std(self) -> float:
+        return float(np.std(self.emissivity, ddof=1))
+
+    def percentiles(self, q: tuple[float, ...] = (5, 50, 95)) -> dict[float, float]:
+        return dict(zip(q, np.percentile(self.emissivity, q).tolist(), strict=True))
+
+    def sensitivities(self) -> dict[str, float]:
+        """Spearman-Rangkorrelation jedes Parameters mit der Emissivität, nach Betrag sortiert"""
+        correlations = {
+            name: float(stats.spearmanr(values, self.emissivity).statistic) for name, values in self.samples.items()
+        }
+        return dict(sorted(correlations.items(), key=lambda item: abs(item[1]), reverse=True))
+
+
+def run_ensemble(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    wn_grid: np.ndarray,
+    *,
+    gamma: Normal,
+    path_length: Normal,
+    temperature: Normal,
+    concentration: Normal,
+    temperature_surface: float = 288.0,
+    n_groups: int = 16,
+    members_per_group: int = 32,
+    seed: int | None = None,
+    max_workers: int | None = None,
+) -> EnsembleResult:
+    """
+    Monte-Carlo-Ensemble der totalen Emissivität
+
+    Linienbreite und Weglänge (über den effektiven Druck) verändern die Form des Spektrums und werden
+    pro Gruppe gezogen. Temperatur und Konzentration skalieren die optische Tiefe nur linear und werden pro
+    Mitglied gezogen, sodass sich alle Mitglieder einer Gruppe einen Absorptionsquerschnitt teilen.
+    Die Querschnitte der Gruppen werden parallel in einem Prozesspool berechnet.
+    """
+    rng = np.random.default_rng(seed)
+    n_members = n_groups * members_per_group
+
+    gamma_groups = gamma.sample(rng, n_groups)
+    path_length_groups = path_length.sample(rng, n_groups)
+    pressure_groups = effective_pressure(path_length_groups)
+
+    temperatures = temperature.sample(rng, n_members).reshape(n_groups, members_per_group)
+    concentrations = concentration.sample(rng, n_members).reshape(n_groups, members_per_group)
+
+    worker = functools.partial(calculate_cross_section, wavenumbers, intensities, wn_grid)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        cross_sections = list(pool.map(worker, gamma_groups * pressure_groups))
+
+    emissivity = np.empty((n_groups, members_per_group))
+
+    for i, cross_section in enumerate(cross_sections):
+        column = number_density(pressure_groups[i], temperatures[i], concentrations[i]) * path_length_groups[i] * 100
+        optical_depth = column[:, np.newaxis] * cross_section
+        absorbance = 1 - np.exp(-optical_depth)
+        emissivity[i] = calculate_total_emissivity(wn_grid, absorbance, temperature=temperature_surface)
+
+    samples = {
+        "gamma": np.repeat(gamma_groups, members_per_group),
+        "path_length": np.repeat(path_length_groups, members_per_group),
+        "temperature": temperatures.ravel(),
+        "concentration": concentrations.ravel(),
+    }
+
+    return EnsembleResult(samples=samples, emissivity=emissivity.ravel())
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import pathlib
+import typing as t
+
+import numpy as np
+
+FORMAT_VERSION = 1
+ARRAYS = ("wavenumber", "absorbance", "optical_depth")
+
+
+def line_set_hash(wavenumbers: np.ndarray, intensities: np.ndarray) -> str:
+    """
+    SHA-256 über Wellenzahlen und Intensitäten, identifiziert den verwendeten Liniensatz
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(wavenumbers, dtype="<f8").tobytes())
+    digest.update(np.ascontiguousarray(intensities, dtype="<f8").tobytes())
+    return digest.hexdigest()
+
+
+def downsample_peaks(values: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Indizes für eine Ausdünnung auf höchstens `n_points` Punkte, die Minima und Maxima erhält
+
+    Das Gitter wird in (n_points - 2) / 2 Abschnitte geteilt, aus jedem werden Minimum und Maximum
+    übernommen, dazu kommen der erste und der letzte Punkt.
+    """
+    if values.size <= n_points:
+        return np.arange(values.size)
+
+    n_buckets = max(1, (n_points - 2) // 2)
+    edges = np.linspace(0, values.size, n_buckets + 1).astype(int)
+
+    indices = []
+    for start, stop in itertools.pairwise(edges):
+        bucket = values[start:stop]
+        indices.extend((start + int(np.argmin(bucket)), start + int(np.argmax(bucket))))
+
+    return np.unique([0, *indices, values.size - 1])
+
+
+def export_spectrum(
+    directory: str | pathlib.Path,
+    wn_grid: np.ndarray,
+    absorbance: np.ndarray,
+    optical_depth: np.ndarray,
+    *,
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    csv_points: int | None = None,
+    **parameters: float,
+) -> pathlib.Path:
+    """
+    Schreibt ein berechnetes Spektrum als .npy-Spalten plus metadata.json
+
+    Die .npy-Dateien lassen sich mit `load_spectrum` ohne Kopie einblenden (memory-map). `parameters` sind
+    die physikalischen Parameter der Rechnung (Weglänge, Druck, ...). Mit `csv_points` wird zusätzlich eine
+    ausgedünnte spectrum.csv für pgfplots geschrieben.
+    """
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    columns = dict(zip(ARRAYS, (wn_grid, absorbance, optical_depth), strict=True))
+    for name, values in columns.items():
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(values, dtype="<f8"))
+
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "n_points": int(np.size(wn_grid)),
+        "wn_min": float(np.min(wn_grid)),
+        "wn_max": float(np.max(wn_grid)),
+        "n_lines": int(np.size(wavenumbers)),
+        "line_set_hash": line_set_hash(wavenumbers, intensities),
+        "parameters": {key: float(value) for key, value in parameters.items()},
+        "arrays": {name: f"{name}.npy" for name in ARRAYS},
+    }
+
+    if csv_points is not None:
+        indices = downsample_peaks(np.asarray(absorbance), csv_points)
+        table = np.column_stack([np.asarray(values)[indices] for values in columns.values()])
+        np.savetxt(directory / "spectrum.csv", table, delimiter=",", fmt="%.8g", header=",".join(ARRAYS), comments="")
+        metadata["csv"] = {"file": "spectrum.csv", "n_points": int(indices.size)}
+
+    with (directory / "metadata.json").open("w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=4)
+
+    return directory
+
+
+def load_spectrum(directory: str | pathlib.Path) -> tuple[dict[str, t.Any], dict[str, np.ndarray]]:
+    """
+    Lädt ein mit `export_spectrum` geschriebenes Spektrum, die Arrays werden nur eingeblendet
+    """
+    directory = pathlib.Path(directory)
+
+    with (directory / "metadata.json").open(encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    arrays = {name: np.load(directory / filename, mmap_mode="r") for name, filename in metadata["arrays"].items()}
+
+    return metadata, arrays
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import numpy as np
-from scipy import constants
+
+from simulationen import lazy_import
+
+constants = lazy_import("scipy.constants")
 
 
 def plancks_law(wavelength: float, temperature: float, *, refractive_index: float = 1.0) -> float:
@@ -38,3 +41,95 @@ def effective_pressure(height: float) -> float:
     h = 8.5
     p0 = 1.013
     return p0 * h / height_km * (1 - np.exp(-height_km / h))
+
+
+def plancks_law_wavenumber(wavenumber: np.ndarray, temperature: np.ndarray) -> np.ndarray:
+    """Planck's radiation law in wavenumber representation
+
+    `wavenumber` in cm^-1, returns spectral radiance in W/(m^2 cm^-1)
+    """
+    c1 = 2 * constants.pi * constants.h * constants.c**2
+    c2 = constants.h * constants.c / constants.k
+    return c1 * 1e8 * wavenumber**3 / np.expm1(c2 * 100 * wavenumber / temperature)
+
+
+def brightness_temperature(
+    wavelength: np.ndarray, radiance: np.ndarray, *, refractive_index: float = 1.0
+) -> np.ndarray:
+    """Inverse of Planck's radiation law
+
+    Returns the temperature of a black body emitting `radiance` (W/(m^3)) at `wavelength`.
+    Broadcasts, so a whole stack of spectra (..., n) can be converted at once.
+    """
+    c1 = 2 * constants.pi * constants.h * constants.c**2 / refractive_index**2
+    c2 = constants.h * constants.c / constants.k
+    return c2 / (wavelength * np.log1p(c1 / (wavelength**5 * radiance)))
+
+
+def brightness_temperature_wavenumber(wavenumber: np.ndarray, radiance: np.ndarray) -> np.ndarray:
+    """Inverse of `plancks_law_wavenumber`
+
+    `wavenumber` in cm^-1, `radiance` in W/(m^2 cm^-1)
+    """
+    c1 = 2 * constants.pi * constants.h * constants.c**2
+    c2 = constants.h * constants.c / constants.k
+    return c2 * 100 * wavenumber / np.log1p(c1 * 1e8 * wavenumber**3 / radiance)
+
+
+def find_spectral_peak(grid: np.ndarray, spectra: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Numerical peak finder for spectra of shape (..., n) on a (not necessarily uniform) grid
+
+    Refines the maximum sample with a parabola through its neighbours.
+    Returns peak position and peak value for every spectrum.
+    """
+    spectra = np.asarray(spectra, dtype=float)
+    index = np.argmax(spectra, axis=-1)
+    inner = np.clip(index, 1, grid.size - 2)
+
+    x0, x1, x2 = grid[inner - 1], grid[inner], grid[inner + 1]
+    y0, y1, y2 = (np.take_along_axis(spectra, (inner + k)[..., np.newaxis], axis=-1)[..., 0] for k in (-1, 0, 1))
+
+    denominator = (x0 - x1) * (x0 - x2) * (x1 - x2)
+    a = (x2 * (y1 - y0) + x1 * (y0 - y2) + x0 * (y2 - y1)) / denominator
+    b = (x2**2 * (y0 - y1) + x1**2 * (y2 - y0) + x0**2 * (y1 - y2)) / denominator
+    c = (x1 * x2 * (x1 - x2) * y0 + x2 * x0 * (x2 - x0) * y1 + x0 * x1 * (x0 - x1) * y2) / denominator
+
+    refine = (index == inner) & (a < 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        peak_position = np.where(refine, -b / (2 * a), grid[index])
+        peak_value = np.where(
+            refine, c - b**2 / (4 * a), np.take_along_axis(spectra, index[..., np.newaxis], -1)[..., 0]
+        )
+
+    return peak_position, peak_value
+
+
+def wiens_displacement_numerical(
+    temperatures: np.ndarray, grid: np.ndarray, *, representation: str = "wavelength", chunk_size: int = 256
+) -> tuple[np.ndarray, np.ndarray]:
+    """Numerical Wien peak for many temperatures at once
+
+    `grid` is in m for `representation="wavelength"` and in cm^-1 for `representation="wavenumber"`.
+    The temperatures are evaluated in blocks of `chunk_size` as (temperatures x grid) arrays.
+    """
+    if representation == "wavelength":
+        law = plancks_law
+    elif representation == "wavenumber":
+        law = plancks_law_wavenumber
+    else:
+        msg = f"Unknown representation: {representation!r}"
+        raise ValueError(msg)
+
+    temperatures = np.asarray(temperatures, dtype=float)
+    peak_position = np.empty_like(temperatures)
+    peak_value = np.empty_like(temperatures)
+
+    for start in range(0, temperatures.size, chunk_size):
+        block = temperatures[start : start + chunk_size]
+        with np.errstate(over="ignore"):
+            spectra = law(grid, block[:, np.newaxis])
+        peak_position[start : start + chunk_size], peak_value[start : start + chunk_size] = find_spectral_peak(
+            grid, spectra
+        )
+
+    return peak_position, peak_value
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+
+from simulationen import lazy_import
+from simulationen.formeln import plancks_law_wavenumber
+from simulationen.utils import CHUNK_ELEMENTS
+from simulationen.utils import calculate_total_emissivity
+from simulationen.utils import number_density
+from simulationen.utils import scale_line_intensities
+
+constants = lazy_import("scipy.constants")
+
+PARAMETERS = ("concentration", "path_length", "gamma", "temperature")
+
+
+@dataclasses.dataclass(frozen=True)
+class SpectrumJacobians:
+    """
+    Vorwärtsspektrum mit Ableitungen nach `PARAMETERS`
+
+    `emissivity_kernels[x]` ist der Integrand von ∂ε/∂x pro Wellenzahl, über das Gitter integriert ergibt er
+    `emissivity_derivatives[x]`.
+    """
+
+    wn_grid: np.ndarray
+    absorbance: np.ndarray
+    optical_depth: np.ndarray
+    emissivity: float
+    optical_depth_derivatives: dict[str, np.ndarray]
+    absorbance_derivatives: dict[str, np.ndarray]
+    emissivity_kernels: dict[str, np.ndarray]
+    emissivity_derivatives: dict[str, float]
+
+
+def _intensity_temperature_derivative(
+    wavenumbers: np.ndarray, lower_state_energy: np.ndarray, temperature: float
+) -> np.ndarray:
+    """d ln S / dT passend zu `scale_line_intensities`"""
+    c2 = 100 * constants.h * constants.c / constants.k
+    return (
+        -1 / temperature
+        + c2 * lower_state_energy / temperature**2
+        - (c2 * wavenumbers / temperature**2) / np.expm1(c2 * wavenumbers / temperature)
+    )
+
+
+def create_absorption_spectrum_with_jacobians(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    wn_grid: np.ndarray,
+    path_length: float = 1.0,
+    concentration: float = 400e-6,
+    pressure: float = 1.0,
+    temperature: float = 296,
+    gamma: float = 0.1,
+    *,
+    lower_state_energy: np.ndarray | None = None,
+    temperature_surface: float = 288.0,
+) -> SpectrumJacobians:
+    """
+    Berechnet Spektrum, Emissivität und deren analytische Ableitungen in einem Durchlauf über die Linien
+
+    Konzentration und Weglänge gehen linear in die optische Tiefe ein, ihre Ableitungen sind daher direkt
+    τ/c und τ/L (bei festem Druck). Für die Linienbreite und, mit `lower_state_energy`, für die
+    Temperaturabhängigkeit der Linienintensitäten werden die zusätzlichen Linienprofile in derselben Schleife
+    wie der Querschnitt aufsummiert. Ohne `lower_state_energy` wirkt die Temperatur nur über die Teilchenzahldichte.
+    """
+    wavenumbers = np.asarray(wavenumbers, dtype=float)
+    intensities = np.asarray(intensities, dtype=float)
+
+    if lower_state_energy is not None:
+        lower_state_energy = np.asarray(lower_state_energy, dtype=float)
+        intensities = scale_line_intensities(wavenumbers, intensities, lower_state_energy, temperature)
+        intensity_derivative = intensities * _intensity_temperature_derivative(
+            wavenumbers, lower_state_energy, temperature
+        )
+
+    gamma_l = gamma * pressure
+    column = number_density(pressure, temperature, concentration) * path_length * 100
+
+    cross_section = np.zeros_like(wn_grid, dtype=float)
+    cross_section_gamma = np.zeros_like(wn_grid, dtype=float)
+    cross_section_temperature = np.zeros_like(wn_grid, dtype=float)
+
+    chunk_size = max(1, CHUNK_ELEMENTS // max(1, wn_grid.size))
+
+    for start in range(0, wavenumbers.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        distance_squared = (wn_grid - wavenumbers[chunk, np.newaxis]) ** 2
+        denominator = distance_squared + gamma_l**2
+
+        lorentz = (gamma_l / np.pi) / denominator
+        lorentz_gamma = (distance_squared - gamma_l**2) / (np.pi * denominator**2)
+
+        cross_section += intensities[chunk] @ lorentz
+        cross_section_gamma += intensities[chunk] @ lorentz_gamma
+        if lower_state_energy is not None:
+            cross_section_temperature += intensity_derivative[chunk] @ lorentz
+
+    optical_depth = column * cross_section
+    transmission = np.exp(-optical_depth)
+    absorbance = 1 - transmission
+
+    optical_depth_derivatives = {
+        "concentration": optical_depth / concentration,
+        "path_length": optical_depth / path_length,
+        "gamma": column * pressure * cross_section_gamma,
+        "temperature": -optical_depth / temperature + column * cross_section_temperature,
+    }
+    absorbance_derivatives = {name: transmission * d for name, d in optical_depth_derivatives.items()}
+
+    weight = plancks_law_wavenumber(wn_grid, temperature_surface) / (constants.sigma * temperature_surface**4)
+    emissivity_kernels = {name: d * weight for name, d in absorbance_derivatives.items()}
+    emissivity_derivatives = {name: float(np.trapezoid(k, wn_grid)) for name, k in emissivity_kernels.items()}
+
+    return SpectrumJacobians(
+        wn_grid=wn_grid,
+        absorbance=absorbance,
+        optical_depth=optical_depth,
+        emissivity=calculate_total_emissivity(wn_grid, absorbance, temperature=temperature_surface),
+        optical_depth_derivatives=optical_depth_derivatives,
+        absorbance_derivatives=absorbance_derivatives,
+        emissivity_kernels=emissivity_kernels,
+        emissivity_derivatives=emissivity_derivatives,
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from simulationen.utils import calculate_cross_section
+from simulationen.utils import number_density
+
+
+class LazySpectrum:
+    """
+    Absorptionsspektrum, das erst bei Bedarf und nur für den angefragten Ausschnitt berechnet wird
+
+    Der Bereich wird in Kacheln der Breite `tile_width` zerlegt. Eine Kachel wird pro Auflösung nur einmal
+    berechnet und danach aus dem Cache genommen. Linien innerhalb von `wing_cutoff` um eine Kachel werden
+    exakt ausgewertet, die glatten Flügel aller weiter entfernten Linien nur auf `far_points` Stützstellen
+    und dann interpoliert.
+
+    `points_per_linewidth` bezieht sich auf die druckverbreiterte Halbwertsbreite `gamma * pressure`.
+    """
+
+    def __init__(
+        self,
+        wavenumbers: np.ndarray,
+        intensities: np.ndarray,
+        wn_min: float,
+        wn_max: float,
+        *,
+        path_length: float = 1.0,
+        concentration: float = 400e-6,
+        pressure: float = 1.0,
+        temperature: int = 296,
+        gamma: float = 0.1,
+        points_per_linewidth: float = 2.0,
+        tile_width: float = 1.0,
+        wing_cutoff: float = 25.0,
+        far_points: int = 9,
+    ) -> None:
+        order = np.argsort(wavenumbers)
+        self.wavenumbers = np.asarray(wavenumbers, dtype=float)[order]
+        self.intensities = np.asarray(intensities, dtype=float)[order]
+
+        self.wn_min = wn_min
+        self.wn_max = wn_max
+        self.gamma_l = gamma * pressure
+        self.column = number_density(pressure, temperature, concentration) * path_length * 100
+
+        self.points_per_linewidth = points_per_linewidth
+        self.tile_width = tile_width
+        self.wing_cutoff = wing_cutoff
+        self.far_points = far_points
+
+        self._tiles: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+
+    def overview(self, points_per_linewidth: float | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gesamter Bereich, standardmäßig mit der groben Auflösung `points_per_linewidth`"""
+        return self.window(self.wn_min, self.wn_max, points_per_linewidth)
+
+    def window(
+        self, wn_min: float, wn_max: float, points_per_linewidth: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gibt Wellenzahlgitter, Absorptionsgrad und optische Tiefe für den Ausschnitt [wn_min, wn_max] zurück
+
+        Liegt der Ausschnitt ganz außerhalb des Bereichs, sind alle drei Arrays leer.
+        """
+        if points_per_linewidth is None:
+            points_per_linewidth = self.points_per_linewidth
+
+        wn_min = max(wn_min, self.wn_min)
+        wn_max = min(wn_max, self.wn_max)
+
+        if wn_min > wn_max:
+            empty = np.empty(0)
+            return empty, empty.copy(), empty.copy()
+
+        n_points = math.ceil(self.tile_width * points_per_linewidth / self.gamma_l)
+
+        first = int((wn_min - self.wn_min) // self.tile_width)
+        last = int((wn_max - self.wn_min) // self.tile_width)
+
+        tiles = [self._tile(index, n_points) for index in range(first, last + 1)]
+        wn_grid = np.concatenate([grid for grid, _ in tiles])
+        optical_depth = np.concatenate([tau for _, tau in tiles])
+
+        mask = (wn_grid >= wn_min) & (wn_grid <= wn_max)
+        wn_grid = wn_grid[mask]
+        optical_depth = optical_depth[mask]
+
+        absorbance = 1 - np.exp(-optical_depth)
+
+        return wn_grid, absorbance, optical_depth
+
+    def _tile(self, index: int, n_points: int) -> tuple[np.ndarray, np.ndarray]:
+        key = (index, n_points)
+        if key not in self._tiles:
+            self._tiles[key] = self._compute_tile(index, n_points)
+        return self._tiles[key]
+
+    def _compute_tile(self, index: int, n_points: int) -> tuple[np.ndarray, np.ndarray]:
+        start = self.wn_min + index * self.tile_width
+        end = start + self.tile_width
+        wn_grid = start + np.arange(n_points) * (self.tile_width / n_points)
+
+        near_start, near_end = np.searchsorted(self.wavenumbers, [start - self.wing_cutoff, end + self.wing_cutoff])
+
+        cross_section = calculate_cross_section(
+            self.wavenumbers[near_start:near_end], self.intensities[near_start:near_end], wn_grid, self.gamma_l
+        )
+
+        far = np.r_[0:near_start, near_end : self.wavenumbers.size]
+        if far.size:
+            far_grid = np.linspace(start, end, self.far_points)
+            far_cross_section = calculate_cross_section(
+                self.wavenumbers[far], self.intensities[far], far_grid, self.gamma_l
+            )
+            cross_section += np.interp(wn_grid, far_grid, far_cross_section)
+
+        return wn_grid, cross_section * self.column
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import tempfile
+import time
+import typing as t
+
+import numpy as np
+
+from simulationen import lazy_import
+from simulationen.formeln import effective_pressure
+from simulationen.jacobians import create_absorption_spectrum_with_jacobians
+from simulationen.lazy_spectrum import LazySpectrum
+from simulationen.temperature_sweep import calculate_total_emissivity_batch
+from simulationen.utils import HITRAN_DTYPE
+from simulationen.utils import calculate_cross_section
+from simulationen.utils import calculate_total_emissivity
+from simulationen.utils import create_absorption_spectrum_streaming
+from simulationen.utils import iter_hitran_blocks
+from simulationen.utils import number_density
+from simulationen.utils import read_hitran_par
+
+referenz = lazy_import("simulationen.referenz")
+pd = lazy_import("pandas")
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    name: str
+    wavenumbers: np.ndarray
+    intensities: np.ndarray
+    wn_grid: np.ndarray
+    path_length: float = 1.0
+    concentration: float = 400e-6
+    pressure: float = 1.0
+    temperature: float = 296
+    gamma: float = 0.1
+    temperature_surface: float = 288.0
+
+    @property
+    def parameters(self) -> dict[str, float]:
+        return {
+            "path_length": self.path_length,
+            "concentration": self.concentration,
+            "pressure": self.pressure,
+            "temperature": self.temperature,
+            "gamma": self.gamma,
+        }
+
+
+@dataclasses.dataclass(frozen=True)
+class ParityResult:
+    engine: str
+    scenario: str
+    n_points: int
+    max_deviation: float
+    rms_deviation: float
+    emissivity_deviation: float
+    speedup: float
+
+    def passed(self, tolerance: float) -> bool:
+        return self.max_deviation <= tolerance and self.emissivity_deviation <= tolerance
+
+
+SpectrumEngine = t.Callable[[Scenario], tuple[np.ndarray, np.ndarray, np.ndarray]]
+"""Berechnet (Wellenzahlgitter, Absorptionsgrad, optische Tiefe) für ein Szenario"""
+
+ReaderEngine = t.Callable[[pathlib.Path], "pd.DataFrame"]
+EmissivityEngine = t.Callable[[np.ndarray, np.ndarray, float], float]
+
+
+def _cross_section_engine(scenario: Scenario) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cross_section = calculate_cross_section(
+        scenario.wavenumbers, scenario.intensities, scenario.wn_grid, scenario.gamma * scenario.pressure
+    )
+    column = number_density(scenario.pressure, scenario.temperature, scenario.concentration) * scenario.path_length
+    optical_depth = column * 100 * cross_section
+    return scenario.wn_grid, 1 - np.exp(-optical_depth), optical_depth
+
+
+def _lazy_spectrum_engine(scenario: Scenario) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    delta_wn = (scenario.wn_grid[-1] - scenario.wn_grid[0]) / (scenario.wn_grid.size - 1)
+    spectrum = LazySpectrum(
+        scenario.wavenumbers,
+        scenario.intensities,
+        scenario.wn_grid[0],
+        scenario.wn_grid[-1],
+        **scenario.parameters,
+        points_per_linewidth=scenario.gamma * scenario.pressure / delta_wn,
+    )
+    return spectrum.overview()
+
+
+def _streaming_engine(scenario: Scenario) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    lines = np.zeros(scenario.wavenumbers.size, dtype=HITRAN_DTYPE)
+    lines["wavenumber"] = scenario.wavenumbers
+    lines["intensity"] = scenario.intensities
+    blocks = np.array_split(lines, max(1, lines.size // 1000))
+
+    absorbance, optical_depth = create_absorption_spectrum_streaming(blocks, scenario.wn_grid, **scenario.parameters)
+    return scenario.wn_grid, absorbance, optical_depth
+
+
+def _jacobians_engine(scenario: Scenario) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    result = create_absorption_spectrum_with_jacobians(
+        scenario.wavenumbers, scenario.intensities, scenario.wn_grid, **scenario.parameters
+    )
+    return scenario.wn_grid, result.absorbance, result.optical_depth
+
+
+def _batch_emissivity_engine(wn_grid: np.ndarray, absorbance: np.ndarray, temperature: float) -> float:
+    return float(calculate_total_emissivity_batch(wn_grid, absorbance, np.array([temperature]))[0])
+
+
+def _streaming_reader(filename: pathlib.Path) -> pd.DataFrame:
+    return pd.DataFrame(np.concatenate(list(iter_hitran_blocks(filename, block_size=4096))))
+
+
+SPECTRUM_ENGINES: dict[str, SpectrumEngine] = {
+    "cross_section": _cross_section_engine,
+    "lazy_spectrum": _lazy_spectrum_engine,
+    "streaming": _streaming_engine,
+    "jacobians": _jacobians_engine,
+}
+READER_ENGINES: dict[str, ReaderEngine] = {"read_hitran_par": read_hitran_par, "iter_hitran_blocks": _streaming_reader}
+EMISSIVITY_ENGINES: dict[str, EmissivityEngine] = {
+    "calculate_total_emissivity": calculate_total_emissivity,
+    "calculate_total_emissivity_batch": _batch_emissivity_engine,
+}
+
+
+def _grid(wavenumbers: np.ndarray, gamma: float, points_per_linewidth: float) -> np.ndarray:
+    wn_min = wavenumbers.min()
+    wn_max = wavenumbers.max()
+    n_points = int((wn_max - wn_min) / (gamma / points_per_linewidth))
+    return np.linspace(wn_min, wn_max, n_points)
+
+
+def main_scenarios(df: pd.DataFrame) -> list[Scenario]:
+    """
+    Die Parametersätze der `main()`-Funktionen der einzelnen Simulationen
+    """
+
+    def lines(wn_min: float, wn_max: float) -> tuple[np.ndarray, np.ndarray]:
+        filtered = df[(df["wavenumber"] >= wn_min) & (df["wavenumber"] <= wn_max)]
+        return filtered["wavenumber"].to_numpy(), filtered["intensity"].to_numpy()
+
+    wn_all, s_all = lines(-np.inf, np.inf)
+    wn_all_filtered, s_all_filtered = lines(555, 100000)
+    wn_small, s_small = lines(6666, 1000000)
+    wn_v2, s_v2 = lines(630, 710)
+    wn_v3, s_v3 = lines(2300, 2390)
+
+    return [
+        Scenario("co2_spektrum", wn_all_filtered, s_all_filtered, _grid(wn_all_filtered, 0.1, 0.12), path_length=100.0),
+        Scenario(
+            "co2_spektrum_under_1_5",
+            wn_small,
+            s_small,
+            np.linspace(wn_small.min(), wn_small.max(), 5000),
+            path_length=100.0,
+        ),
+        Scenario("co2_spektrum_v2_band", wn_v2, s_v2, _grid(wn_v2, 0.1, 20), path_length=1.0, pressure=0.1),
+        Scenario("co2_spektrum_v3_band", wn_v3, s_v3, _grid(wn_v3, 0.4, 20), path_length=0.4, pressure=0.1, gamma=0.4),
+        Scenario(
+            "co2_absorptionsgrad",
+            wn_all,
+            s_all,
+            _grid(wn_all, 0.1, 0.08),
+            path_length=8000,
+            concentration=425e-6,
+            pressure=effective_pressure(8000),
+            temperature=255,
+        ),
+    ]
+
+
+def synthetic_lines(
+    n_lines: int, wn_min: float, wn_max: float, *, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Zufälliger Liniensatz mit log-gleichverteilten Intensitäten und unteren Energieniveaus
+    """
+    rng = np.random.default_rng(seed)
+    wavenumbers = np.sort(rng.uniform(wn_min, wn_max, n_lines))
+    intensities = 10 ** rng.uniform(-26, -18, n_lines)
+    lower_state_energy = rng.uniform(0, 3000, n_lines)
+    return wavenumbers, intensities, lower_state_energy
+
+
+def synthetic_scenarios() -> list[Scenario]:
+    wavenumbers, intensities, _ = synthetic_lines(500, 600, 740, seed=1)
+    dense_wavenumbers, dense_intensities, _ = synthetic_lines(5000, 2200, 2400, seed=2)
+
+    return [
+        Scenario("synthetisch_duenn", wavenumbers, intensities, _grid(wavenumbers, 0.1, 20), pressure=0.1),
+        Scenario(
+            "synthetisch_dick",
+            wavenumbers,
+            intensities,
+            _grid(wavenumbers, 0.1, 2),
+            path_length=8000,
+            pressure=effective_pressure(8000),
+            temperature=255,
+        ),
+        Scenario("synthetisch_dicht", dense_wavenumbers, dense_intensities, _grid(dense_wavenumbers, 0.4, 5)),
+    ]
+
+
+def write_synthetic_par(filename: pathlib.Path, n_lines: int, *, seed: int = 0) -> None:
+    """
+    Schreibt einen synthetischen Liniensatz im 160-Zeichen HITRAN .par Format
+    """
+    wavenumbers, intensities, lower_state_energy = synthetic_lines(n_lines, 500, 2500, seed=seed)
+    rng = np.random.default_rng(seed)
+    isotopologues = rng.integers(1, 4, n_lines)
+
+    with filename.open("w") as f:
+        for wn, intensity, energy, isotopologue in zip(
+            wavenumbers, intensities, lower_state_energy, isotopologues, strict=True
+        ):
+            line = f" 2{isotopologue:1d}{wn:12.6f}{intensity:10.3E}{1.0:10.3E}{'.0700'}{0.08:5.3f}{energy:10.4f}0.75"
+            f.write(f"{line:<160}\n")
+
+
+def _timed[T](function: t.Callable[[], T], repeat: int) -> tuple[T, float]:
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _deviation(values: np.ndarray, reference: np.ndarray) -> tuple[float, float]:
+    difference = np.asarray(values, dtype=float) - np.asarray(reference, dtype=float)
+    return float(np.max(np.abs(difference), initial=0.0)), float(np.sqrt(np.mean(difference**2)))
+
+
+def check_spectrum_engines(scenarios: t.Iterable[Scenario], *, repeat: int = 1) -> list[ParityResult]:
+    results = []
+
+    for scenario in scenarios:
+        for name, engine in SPECTRUM_ENGINES.items():
+            (wn_grid, absorbance, _), engine_time = _timed(lambda e=engine, s=scenario: e(s), repeat)
+
+            (reference, _), reference_time = _timed(
+                lambda g=wn_grid, s=scenario: referenz.create_absorption_spectrum(
+                    s.wavenumbers, s.intensities, g, **s.parameters
+                ),
+                repeat,
+            )
+
+            max_deviation, rms_deviation = _deviation(absorbance, reference)
+            emissivity = calculate_total_emissivity(wn_grid, absorbance, scenario.temperature_surface)
+            reference_emissivity = referenz.calculate_total_emissivity(wn_grid, reference, scenario.temperature_surface)
+
+            results.append(
+                ParityResult(
+                    engine=name,
+                    scenario=scenario.name,
+                    n_points=wn_grid.size,
+                    max_deviation=max_deviation,
+                    rms_deviation=rms_deviation,
+                    emissivity_deviation=abs(emissivity - reference_emissivity),
+                    speedup=reference_time / engine_time,
+                )
+            )
+
+    return results
+
+
+def check_emissivity_engines(scenarios: t.Iterable[Scenario], *, repeat: int = 5) -> list[ParityResult]:
+    results = []
+
+    for scenario in scenarios:
+        absorbance, _ = referenz.create_absorption_spectrum(
+            scenario.wavenumbers, scenario.intensities, scenario.wn_grid, **scenario.parameters
+        )
+        reference, reference_time = _timed(
+            lambda a=absorbance, s=scenario: referenz.calculate_total_emissivity(
+                s.wn_grid, a, temperature=s.temperature_surface
+            ),
+            repeat,
+        )
+
+        for name, engine in EMISSIVITY_ENGINES.items():
+            emissivity, engine_time = _timed(
+                lambda e=engine, a=absorbance, s=scenario: e(s.wn_grid, a, s.temperature_surface), repeat
+            )
+            results.append(
+                ParityResult(
+                    engine=name,
+                    scenario=scenario.name,
+                    n_points=scenario.wn_grid.size,
+                    max_deviation=0.0,
+                    rms_deviation=0.0,
+                    emissivity_deviation=abs(float(emissivity) - float(reference)),
+                    speedup=reference_time / engine_time,
+                )
+            )
+
+    return results
+
+
+def check_reader_engines(n_lines: int = 20000, *, repeat: int = 3) -> list[ParityResult]:
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = pathlib.Path(directory) / "synthetisch.par"
+        write_synthetic_par(filename, n_lines)
+
+        reference, reference_time = _timed(lambda: referenz.read_hitran_par(filename), repeat)
+
+        for name, engine in READER_ENGINES.items():
+            df, engine_time = _timed(lambda e=engine: e(filename), repeat)
+
+            max_deviation = 0.0
+            rms_deviation = 0.0
+            if len(df) != len(reference):
+                max_deviation = rms_deviation = np.inf
+            else:
+                for column in reference.columns:
+                    column_max, column_rms = _deviation(df[column].to_numpy(), reference[column].to_numpy())
+                    max_deviation = max(max_deviation, column_max)
+                    rms_deviation = max(rms_deviation, column_rms)
+
+            results.append(
+                ParityResult(
+                    engine=name,
+                    scenario=f"synthetisch_{n_lines}_linien",
+                    n_points=len(df),
+                    max_deviation=max_deviation,
+                    rms_deviation=rms_deviation,
+                    emissivity_deviation=0.0,
+                    speedup=reference_time / engine_time,
+                )
+            )
+
+    return results
+
+
+def format_report(results: t.Iterable[ParityResult], tolerance: float) -> str:
+    header = (
+        f"{'Engine':<34} {'Szenario':<26} {'Punkte':>9} {'max ΔA':>10} {'RMS ΔA':>10} {'Δε':>10} {'Speedup':>8}  Status"
+    )
+    rows = [header, "-" * len(header)]
+    for r in results:
+        status = "ok" if r.passed(tolerance) else "ABWEICHUNG"
+        rows.append(
+            f"{r.engine:<34} {r.scenario:<26} {r.n_points:>9} {r.max_deviation:>10.2e} {r.rms_deviation:>10.2e} "
+            f"{r.emissivity_deviation:>10.2e} {r.speedup:>7.1f}x  {status}"
+        )
+    return "\n".join(rows)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from simulationen import ROOT_DIR
@@ -16,6 +15,8 @@ SMALL_FONT_SIZE = 15
 
 
 def main() -> None:
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     max_wavelength_sun = wiens_displacement_law(TEMPERATURE_SUN)
     max_wavelength_earth = wiens_displacement_law(TEMPERATURE_EARTH)
 
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS: dict[str, float] = {
+    "simulationen.planck": 0.25,
+    "simulationen.wien": 0.25,
+    "simulationen.co2_spektrum": 0.25,
+    "simulationen.co2_spektrum_under_1_5": 0.25,
+    "simulationen.co2_spektrum_v2_band": 0.25,
+    "simulationen.co2_spektrum_v3_band": 0.25,
+    "simulationen.co2_v2_schwingung": 0.25,
+    "simulationen.co2_absorptionsgrad": 0.25,
+    "simulationen.co2_ensemble": 0.25,
+    "simulationen.co2_paritaet": 0.25,
+    "simulationen.co2_schmalband": 0.25,
+    "simulationen.co2_temperatur": 0.25,
+    "simulationen.co2_sensitivitaet": 0.25,
+}
+# Budget in Sekunden für das Importieren des __main__-Moduls, ohne main() auszuführen
+
+REPEAT = 5
+
+MEASURE = """
+import time
+start = time.perf_counter()
+import {module}.__main__
+print(time.perf_counter() - start)
+"""
+
+
+def measure(module: str) -> float:
+    """Median der Importzeit in einem frischen Interpreter"""
+    timings = [
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", MEASURE.format(module=module)], capture_output=True, check=True, text=True
+            ).stdout
+        )
+        for _ in range(REPEAT)
+    ]
+    return statistics.median(timings)
+
+
+def main() -> None:
+    over_budget = []
+
+    for module, budget in ENTRY_POINTS.items():
+        elapsed = measure(module)
+        status = "ok" if elapsed <= budget else "ZU LANGSAM"
+        print(f"{module:<40} {elapsed * 1000:>7.0f} ms / {budget * 1000:>5.0f} ms  {status}")  # noqa: T201
+        if elapsed > budget:
+            over_budget.append(module)
+
+    if over_budget:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+
+import numpy as np
+
+from simulationen import lazy_import
+from simulationen.export import line_set_hash
+from simulationen.formeln import plancks_law_wavenumber
+from simulationen.utils import calculate_cross_section
+from simulationen.utils import number_density
+from simulationen.utils import scale_line_intensities
+
+constants = lazy_import("scipy.constants")
+
+_INTENSITY_CACHE: dict[tuple[str, str, float, float], np.ndarray] = {}
+
+
+def cached_line_intensities(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    lower_state_energy: np.ndarray,
+    temperature: float,
+    reference_temperature: float = 296.0,
+) -> np.ndarray:
+    """
+    `scale_line_intensities` mit Cache pro Liniensatz, Energie des unteren Zustands und Temperaturpaar
+    """
+    energy_hash = hashlib.sha256(np.ascontiguousarray(lower_state_energy, dtype="<f8").tobytes()).hexdigest()
+    key = (line_set_hash(wavenumbers, intensities), energy_hash, float(temperature), float(reference_temperature))
+    if key not in _INTENSITY_CACHE:
+        _INTENSITY_CACHE[key] = scale_line_intensities(
+            wavenumbers, intensities, lower_state_energy, temperature, reference_temperature
+        )
+    return _INTENSITY_CACHE[key]
+
+
+@dataclasses.dataclass(frozen=True)
+class TemperatureSweep:
+    """
+    Ergebnis von `temperature_sweep`
+
+    `absorbance` hat die Form (Emissionstemperaturen x Gitter), `emissivity` (Emissionstemperaturen x
+    Oberflächentemperaturen) und `outgoing_flux` (Emissionstemperaturen x Oberflächentemperaturen x Gitter)
+    in W/(m^2 cm^-1).
+    """
+
+    wn_grid: np.ndarray
+    surface_temperatures: np.ndarray
+    emission_temperatures: np.ndarray
+    absorbance: np.ndarray
+    emissivity: np.ndarray
+    outgoing_flux: np.ndarray
+
+    @property
+    def total_outgoing_flux(self) -> np.ndarray:
+        """Über das Gitter integrierter Fluss in W/m^2"""
+        return np.trapezoid(self.outgoing_flux, self.wn_grid, axis=-1)
+
+    @property
+    def feedback(self) -> np.ndarray:
+        """Änderung des ausgehenden Flusses mit der Oberflächentemperatur in W/(m^2 K)"""
+        return np.gradient(self.total_outgoing_flux, self.surface_temperatures, axis=-1)
+
+
+def calculate_total_emissivity_batch(
+    wn_grid: np.ndarray, absorbance: np.ndarray, temperatures: np.ndarray
+) -> np.ndarray:
+    """
+    `calculate_total_emissivity` für viele Temperaturen in einem Aufruf
+
+    `absorbance` darf beliebig viele führende Achsen haben (..., Gitter), das Ergebnis hat die Form
+    (..., Temperaturen).
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    planck_wn = plancks_law_wavenumber(wn_grid, temperatures[:, np.newaxis])
+
+    numerator = np.trapezoid(absorbance[..., np.newaxis, :] * planck_wn, wn_grid, axis=-1)
+    denominator = constants.sigma * temperatures**4
+
+    return numerator / denominator
+
+
+def temperature_sweep(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    wn_grid: np.ndarray,
+    surface_temperatures: np.ndarray,
+    emission_temperatures: np.ndarray,
+    *,
+    lower_state_energy: np.ndarray | None = None,
+    path_length: float = 1.0,
+    concentration: float = 400e-6,
+    pressure: float = 1.0,
+    gamma: float = 0.1,
+) -> TemperatureSweep:
+    """
+    Emissivität und spektral aufgelöster ausgehender Fluss für alle Temperaturkombinationen
+
+    Die Schicht hat die Emissionstemperatur, der ausgehende Fluss ist (1 - A) B(T_Oberfläche) + A B(T_Emission).
+    Ohne `lower_state_energy` hängt die optische Tiefe nur über die Teilchenzahldichte von der Temperatur ab,
+    dann reicht ein einziger Absorptionsquerschnitt. Mit `lower_state_energy` werden die Linienintensitäten
+    auf jede Emissionstemperatur umgerechnet (gecacht) und pro Temperatur ein Querschnitt berechnet.
+    """
+    surface_temperatures = np.asarray(surface_temperatures, dtype=float)
+    emission_temperatures = np.asarray(emission_temperatures, dtype=float)
+
+    gamma_l = gamma * pressure
+    columns = number_density(pressure, emission_temperatures, concentration) * path_length * 100
+
+    if lower_state_energy is None:
+        cross_sections = calculate_cross_section(wavenumbers, intensities, wn_grid, gamma_l)[np.newaxis, :]
+    else:
+        cross_sections = np.stack(
+            [
+                calculate_cross_section(
+                    wavenumbers,
+                    cached_line_intensities(wavenumbers, intensities, lower_state_energy, temperature),
+                    wn_grid,
+                    gamma_l,
+                )
+                for temperature in emission_temperatures
+            ]
+        )
+
+    absorbance = 1 - np.exp(-columns[:, np.newaxis] * cross_sections)
+
+    emissivity = calculate_total_emissivity_batch(wn_grid, absorbance, surface_temperatures)
+
+    planck_surface = plancks_law_wavenumber(wn_grid, surface_temperatures[:, np.newaxis])
+    planck_emission = plancks_law_wavenumber(wn_grid, emission_temperatures[:, np.newaxis])
+
+    transmitted = (1 - absorbance[:, np.newaxis, :]) * planck_surface
+    emitted = absorbance * planck_emission
+    outgoing_flux = transmitted + emitted[:, np.newaxis, :]
+
+    return TemperatureSweep(
+        wn_grid=wn_grid,
+        surface_temperatures=surface_temperatures,
+        emission_temperatures=emission_temperatures,
+        absorbance=absorbance,
+        emissivity=emissivity,
+        outgoing_flux=outgoing_flux,
+    )
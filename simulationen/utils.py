@@ -1,10 +1,42 @@
 from __future__ import annotations
 
+import itertools
 import pathlib
+import typing as t
 
 import numpy as np
-import pandas as pd
-from scipy import constants
+
+from simulationen import lazy_import
+
+pd = lazy_import("pandas")
+constants = lazy_import("scipy.constants")
+
+CHUNK_ELEMENTS = 2**16
+# Maximale Anzahl an Elementen (Linien x Gitterpunkte), die pro Block gleichzeitig ausgewertet werden
+
+HITRAN_DTYPE = np.dtype(
+    [
+        ("molecule", "i2"),
+        ("isotopologue", "i2"),
+        ("wavenumber", "f8"),
+        ("intensity", "f8"),
+        ("lower_state_energy", "f8"),
+    ]
+)
+
+_HITRAN_FIELDS = np.dtype(
+    [
+        ("molecule", "S2"),
+        ("isotopologue", "S1"),
+        ("wavenumber", "S12"),
+        ("intensity", "S10"),
+        ("einstein_a", "S10"),
+        ("gamma_air", "S5"),
+        ("gamma_self", "S5"),
+        ("lower_state_energy", "S10"),
+    ]
+)
+# Die ersten 55 Zeichen eines 160-Zeichen HITRAN-Datensatzes
 
 
 def read_hitran_par(filename: str | pathlib.Path) -> pd.DataFrame:
@@ -22,6 +54,7 @@ def read_hitran_par(filename: str | pathlib.Path) -> pd.DataFrame:
             isotopologue = int(line[2:3])
             wavenumber = float(line[3:15])
             intensity = float(line[15:25])
+            lower_state_energy = float(line[45:55])
 
             data.append(
                 {
@@ -29,12 +62,69 @@ def read_hitran_par(filename: str | pathlib.Path) -> pd.DataFrame:
                     "isotopologue": isotopologue,
                     "wavenumber": wavenumber,
                     "intensity": intensity,
+                    "lower_state_energy": lower_state_energy,
                 }
             )
 
     return pd.DataFrame(data)
 
 
+def _isotopologue_numbers(codes: np.ndarray) -> np.ndarray:
+    """HITRAN-Isotopologcodes: 1-9, 0 für 10, A, B, ... für 11, 12, ..."""
+    codes = codes.view(np.uint8).astype(np.int16)
+    numbers = codes - ord("0")
+    numbers[codes == ord("0")] = 10
+    letters = codes >= ord("A")
+    numbers[letters] = codes[letters] - ord("A") + 11
+    return numbers
+
+
+def iter_hitran_blocks(
+    filename: str | pathlib.Path,
+    *,
+    block_size: int = 1_000_000,
+    molecules: t.Collection[int] | None = None,
+    isotopologues: t.Collection[int] | None = None,
+    wn_min: float | None = None,
+    wn_max: float | None = None,
+    min_intensity: float | None = None,
+) -> t.Iterator[np.ndarray]:
+    """
+    Liest eine HITRAN/HITEMP .par Datei blockweise als strukturierte Arrays (`HITRAN_DTYPE`)
+
+    Es werden immer nur `block_size` Zeilen gleichzeitig gehalten, die Filter werden direkt beim Lesen
+    angewendet. Jeder Block enthält höchstens `block_size` Linien, leere Blöcke werden übersprungen.
+    """
+    if isinstance(filename, str):
+        filename = pathlib.Path(filename)
+
+    with filename.open("rb") as f:
+        while lines := list(itertools.islice(f, block_size)):
+            fields = np.array(lines, dtype=f"S{_HITRAN_FIELDS.itemsize}").view(_HITRAN_FIELDS)
+
+            block = np.empty(fields.size, dtype=HITRAN_DTYPE)
+            block["molecule"] = fields["molecule"].astype(np.int16)
+            block["isotopologue"] = _isotopologue_numbers(fields["isotopologue"])
+            block["wavenumber"] = fields["wavenumber"].astype(np.float64)
+            block["intensity"] = fields["intensity"].astype(np.float64)
+            block["lower_state_energy"] = fields["lower_state_energy"].astype(np.float64)
+
+            mask = np.ones(block.size, dtype=bool)
+            if molecules is not None:
+                mask &= np.isin(block["molecule"], list(molecules))
+            if isotopologues is not None:
+                mask &= np.isin(block["isotopologue"], list(isotopologues))
+            if wn_min is not None:
+                mask &= block["wavenumber"] >= wn_min
+            if wn_max is not None:
+                mask &= block["wavenumber"] <= wn_max
+            if min_intensity is not None:
+                mask &= block["intensity"] >= min_intensity
+
+            if mask.any():
+                yield block[mask]
+
+
 def create_absorption_spectrum(
     wavenumbers: np.ndarray,
     intensities: np.ndarray,
@@ -65,6 +155,86 @@ def create_absorption_spectrum(
     return absorbance, optical_depth
 
 
+def number_density(pressure: float, temperature: float, concentration: float) -> float:
+    """
+    Berechnet die Teilchenzahldichte des Absorbers in Moleküle/cm^3
+    """
+    return 2.69e19 * (pressure * 1.0) * (273.15 / temperature) * concentration
+
+
+def calculate_cross_section(
+    wavenumbers: np.ndarray, intensities: np.ndarray, wn_grid: np.ndarray, gamma_l: float
+) -> np.ndarray:
+    """
+    Berechnet den Absorptionsquerschnitt (Summe aller Lorentz-Profile) in cm^2/Molekül
+
+    Der Querschnitt hängt nur von der Linienbreite ab, Konzentration, Weglänge und Temperatur
+    skalieren ihn nur noch linear.
+    """
+    wavenumbers = np.asarray(wavenumbers, dtype=float)
+    intensities = np.asarray(intensities, dtype=float)
+
+    cross_section = np.zeros_like(wn_grid, dtype=float)
+
+    chunk_size = max(1, CHUNK_ELEMENTS // max(1, wn_grid.size))
+
+    for start in range(0, wavenumbers.size, chunk_size):
+        wn = wavenumbers[start : start + chunk_size, np.newaxis]
+        lorentz = (gamma_l / np.pi) / ((wn_grid - wn) ** 2 + gamma_l**2)
+        cross_section += intensities[start : start + chunk_size] @ lorentz
+
+    return cross_section
+
+
+def scale_line_intensities(
+    wavenumbers: np.ndarray,
+    intensities: np.ndarray,
+    lower_state_energy: np.ndarray,
+    temperature: float,
+    reference_temperature: float = 296.0,
+) -> np.ndarray:
+    """
+    Rechnet HITRAN-Linienintensitäten von 296 K auf `temperature` um
+
+    Für die Zustandssumme wird nur der Rotationsanteil eines linearen Moleküls (Q ~ T) berücksichtigt.
+    """
+    c2 = 100 * constants.h * constants.c / constants.k  # zweite Strahlungskonstante in cm K
+
+    partition = reference_temperature / temperature
+    boltzmann = np.exp(-c2 * lower_state_energy * (1 / temperature - 1 / reference_temperature))
+    stimulated = -np.expm1(-c2 * wavenumbers / temperature) / -np.expm1(-c2 * wavenumbers / reference_temperature)
+
+    return intensities * partition * boltzmann * stimulated
+
+
+def create_absorption_spectrum_streaming(
+    blocks: t.Iterable[np.ndarray],
+    wn_grid: np.ndarray,
+    path_length: float = 1.0,
+    concentration: float = 400e-6,
+    pressure: float = 1.0,
+    temperature: int = 296,
+    gamma: float = 0.1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Wie `create_absorption_spectrum`, aber für Linienblöcke aus `iter_hitran_blocks`
+
+    Der Absorptionsquerschnitt wird Block für Block aufsummiert, es liegt nie der ganze Liniensatz im Speicher.
+    """
+    cross_section = np.zeros_like(wn_grid, dtype=float)
+
+    for block in blocks:
+        cross_section += calculate_cross_section(block["wavenumber"], block["intensity"], wn_grid, gamma * pressure)
+
+    optical_depth = number_density(pressure, temperature, concentration) * path_length * 100 * cross_section
+
+    transmission = np.exp(-optical_depth)
+
+    absorbance = 1 - transmission
+
+    return absorbance, optical_depth
+
+
 def calculate_total_emissivity(wn_grid: np.ndarray, absorbance: np.ndarray, temperature: float = 288.0) -> float:
     """
     Berechnet die totale Emissivität durch Integration über das Planck-Spektrum
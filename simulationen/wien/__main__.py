@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from simulationen import ROOT_DIR
@@ -9,10 +8,13 @@ from simulationen.formeln import wiens_displacement_law_temperature
 
 
 def main() -> None:
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     wavelengths = np.linspace(1e-7, 100e-6, 20000)
     temperature_range = np.linspace(500, 5000, 5)
 
-    spectral_radiances = [plancks_law(wavelengths, T) for T in temperature_range]
+    spectral_radiances = plancks_law(wavelengths, temperature_range[:, np.newaxis])
+    # alle Temperaturen in einem Aufruf als (Temperaturen x Wellenlängen)-Array
 
     radiances = plancks_law(wavelengths, wiens_displacement_law_temperature(wavelengths))
 